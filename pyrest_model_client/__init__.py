@@ -1,12 +1,26 @@
-from pyrest_model_client.base import BaseAPIModel, get_model_fields
-from pyrest_model_client.client import AsyncRestApiClient, RestApiClient, build_header
-from pyrest_model_client.consts import HttpMethod
+from pyrest_model_client.base import BaseAPIModel, get_model_fields, parse_model_fields
+from pyrest_model_client.client import (
+    AsyncRestApiClient,
+    CompressionConfig,
+    RestApiClient,
+    TransferStats,
+    build_header,
+    get_transfer_stats,
+)
+from pyrest_model_client.consts import ContentEncoding, HttpMethod
+from pyrest_model_client.hydration import ModelHydrator
 
 __all__ = [
     "BaseAPIModel",
     "get_model_fields",
+    "parse_model_fields",
+    "ModelHydrator",
     "RestApiClient",
     "AsyncRestApiClient",
     "build_header",
     "HttpMethod",
+    "ContentEncoding",
+    "CompressionConfig",
+    "TransferStats",
+    "get_transfer_stats",
 ]
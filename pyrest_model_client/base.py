@@ -1,3 +1,4 @@
+import json
 from typing import TYPE_CHECKING, TypeVar
 
 from python_base_toolkit.base_structures.base_pydantic_model import BasePydanticModel
@@ -5,6 +6,7 @@ from python_base_toolkit.base_structures.base_pydantic_model import BasePydantic
 if TYPE_CHECKING:
     from pyrest_model_client.client import AsyncRestApiClient, RestApiClient
 
+
 class BaseAPIModel(BasePydanticModel):
     """Base model for API resources with automatic resource path handling.
 
@@ -62,3 +64,23 @@ def get_model_fields(items: list[dict], model: type[T]) -> list[T]:
         List of model instances.
     """
     return [model(**item) for item in items]
+
+
+def parse_model_fields(content: bytes | str, model: type[T], results_key: str | None = None) -> list[T]:
+    """Parse a raw JSON page and convert its items to a list of model instances.
+
+    This is a module-level function so it can be shipped to worker processes by ModelHydrator.
+
+    Args:
+        content: Raw JSON response body (e.g., httpx.Response.content).
+        model: The model class to instantiate.
+        results_key: Key holding the item list in paginated responses (e.g., "results").
+            If None, the body itself must be a JSON list.
+
+    Returns:
+        List of model instances.
+    """
+    items = json.loads(content)
+    if results_key is not None:
+        items = items[results_key]
+    return get_model_fields(items, model)
@@ -1,9 +1,27 @@
+import asyncio
+import gzip
+import json
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
 from custom_python_logger import get_logger
 
-from pyrest_model_client.consts import LOGGER_NAME, HttpMethod
+from pyrest_model_client.consts import (
+    DEFAULT_COMPRESSION_THRESHOLD,
+    DEFAULT_GZIP_COMPRESSION_LEVEL,
+    DEFAULT_ZSTD_COMPRESSION_LEVEL,
+    LOGGER_NAME,
+    ContentEncoding,
+    HttpMethod,
+)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+TRANSFER_STATS_EXTENSION = "transfer_stats"
 
 
 def build_header(
@@ -17,6 +35,57 @@ def build_header(
     }
 
 
+@dataclass(frozen=True, slots=True)
+class CompressionConfig:
+    """Request body compression settings.
+
+    Attributes:
+        encoding: Content-Encoding applied to request bodies (gzip or zstd).
+        threshold: Minimum serialized body size in bytes before compression is applied.
+        level: Compression level; None uses the codec's moderate default.
+    """
+
+    encoding: ContentEncoding = ContentEncoding.GZIP
+    threshold: int = DEFAULT_COMPRESSION_THRESHOLD
+    level: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.encoding == ContentEncoding.ZSTD and zstandard is None:
+            raise ValueError(
+                "zstd compression requires the 'zstandard' package (pip install pyrest-model-client[compression])"
+            )
+        if self.threshold < 0:
+            raise ValueError(f"threshold must be non-negative, got {self.threshold}")
+        if self.level is None:
+            return
+        if self.encoding == ContentEncoding.ZSTD and self.level > zstandard.MAX_COMPRESSION_LEVEL:
+            raise ValueError(f"zstd level must be at most {zstandard.MAX_COMPRESSION_LEVEL}, got {self.level}")
+        if self.encoding == ContentEncoding.GZIP and not 0 <= self.level <= 9:
+            raise ValueError(f"gzip level must be between 0 and 9, got {self.level}")
+
+    def compress(self, body: bytes) -> bytes:
+        if self.encoding == ContentEncoding.ZSTD:
+            level = DEFAULT_ZSTD_COMPRESSION_LEVEL if self.level is None else self.level
+            return zstandard.ZstdCompressor(level=level).compress(body)
+        level = DEFAULT_GZIP_COMPRESSION_LEVEL if self.level is None else self.level
+        return gzip.compress(body, compresslevel=level)
+
+
+@dataclass(frozen=True, slots=True)
+class TransferStats:
+    """Bytes-on-wire vs. bytes-decoded for a single request/response exchange."""
+
+    request_bytes_sent: int
+    request_bytes_decoded: int
+    response_bytes_received: int
+    response_bytes_decoded: int
+
+
+def get_transfer_stats(response: httpx.Response) -> TransferStats | None:
+    """Return the TransferStats recorded for a response made by RestApiClient or AsyncRestApiClient."""
+    return response.extensions.get(TRANSFER_STATS_EXTENSION)
+
+
 class _BaseRestClient:
     """Shared config and endpoint logic for sync and async REST clients."""
 
@@ -26,6 +95,7 @@ class _BaseRestClient:
         self.logger = get_logger(LOGGER_NAME)
         self.base_url = base_url.rstrip("/") if base_url else ""
         self.add_trailing_slash = add_trailing_slash
+        self.compression: CompressionConfig | None = None
 
     @staticmethod
     def get_default_timeout(timeout: float | httpx.Timeout | None) -> httpx.Timeout:
@@ -56,6 +126,54 @@ class _BaseRestClient:
     def set_credentials(self, header: dict[str, str]) -> None:
         self.client.headers.update(header)
 
+    def set_compression(self, compression: CompressionConfig | None) -> None:
+        """Enable request body compression with the given settings, or disable it with None."""
+        self.compression = compression
+
+    @staticmethod
+    def serialize_body(data: dict) -> bytes:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    def encode_serialized_body(self, body: bytes) -> tuple[dict[str, Any], int]:
+        """Build the request kwargs for a serialized JSON body, compressing it when it reaches the threshold.
+
+        Args:
+            body: Serialized JSON request body.
+
+        Returns:
+            A tuple of kwargs for httpx request() and the uncompressed body size in bytes.
+        """
+        headers = {} if "Content-Type" in self.client.headers else {"Content-Type": "application/json"}
+        if self.compression is None or len(body) < self.compression.threshold:
+            return {"content": body, "headers": headers}, len(body)
+
+        headers["Content-Encoding"] = self.compression.encoding
+        return {"content": self.compression.compress(body), "headers": headers}, len(body)
+
+    def encode_body(self, data: dict) -> tuple[dict[str, Any], int | None]:
+        """Build the request kwargs for a JSON body according to the client's compression settings.
+
+        Args:
+            data: JSON-serializable request payload.
+
+        Returns:
+            A tuple of kwargs for httpx request() and the uncompressed body size in bytes,
+            or None when the body is handed to httpx as-is.
+        """
+        if self.compression is None:
+            return {"json": data}, None
+        return self.encode_serialized_body(self.serialize_body(data))
+
+    @staticmethod
+    def record_transfer_stats(response: httpx.Response, request_bytes_decoded: int | None) -> None:
+        request_bytes_sent = len(response.request.content)
+        response.extensions[TRANSFER_STATS_EXTENSION] = TransferStats(
+            request_bytes_sent=request_bytes_sent,
+            request_bytes_decoded=request_bytes_sent if request_bytes_decoded is None else request_bytes_decoded,
+            response_bytes_received=response.num_bytes_downloaded,
+            response_bytes_decoded=len(response.content),
+        )
+
 
 class RestApiClient(_BaseRestClient):
     client: httpx.Client
@@ -88,20 +206,26 @@ class RestApiClient(_BaseRestClient):
         )
         self.set_credentials(header=header)
 
-    def _request(self, method: HttpMethod, endpoint: str, **kwargs: Any) -> httpx.Response:
+    def _request(self, method: HttpMethod, endpoint: str, data: dict | None = None, **kwargs: Any) -> httpx.Response:
         """Make an HTTP request.
 
         Args:
             method: HTTP method from HttpMethod enum.
             endpoint: Endpoint path or full URL.
+            data: Optional JSON body, compressed according to the client's compression settings.
             **kwargs: Additional arguments passed to httpx.Client.request().
 
         Returns:
-            httpx.Response object.
+            httpx.Response object, with TransferStats available via get_transfer_stats().
         """
         endpoint = self.normalize_endpoint(endpoint, self.add_trailing_slash)
-        self.logger.debug(f"Making {method} request to {endpoint} with kwargs: {kwargs}")
+        self.logger.debug(f"Making {method} request to {endpoint} with data: {data}, kwargs: {kwargs}")
+        request_bytes_decoded = None
+        if data is not None:
+            body_kwargs, request_bytes_decoded = self.encode_body(data)
+            kwargs.update(body_kwargs)
         response = self.client.request(method, endpoint, **kwargs)
+        self.record_transfer_stats(response, request_bytes_decoded)
         response.raise_for_status()
         return response
 
@@ -109,13 +233,13 @@ class RestApiClient(_BaseRestClient):
         return self._request(HttpMethod.GET, endpoint, params=params or {})
 
     def post(self, endpoint: str, data: dict | None = None) -> httpx.Response:
-        return self._request(HttpMethod.POST, endpoint, json=data or {})
+        return self._request(HttpMethod.POST, endpoint, data=data or {})
 
     def put(self, endpoint: str, data: dict | None = None) -> httpx.Response:
-        return self._request(HttpMethod.PUT, endpoint, json=data or {})
+        return self._request(HttpMethod.PUT, endpoint, data=data or {})
 
     def patch(self, endpoint: str, data: dict | None = None) -> httpx.Response:
-        return self._request(HttpMethod.PATCH, endpoint, json=data or {})
+        return self._request(HttpMethod.PATCH, endpoint, data=data or {})
 
     def delete(self, endpoint: str) -> httpx.Response:
         return self._request(HttpMethod.DELETE, endpoint)
@@ -167,34 +291,51 @@ class AsyncRestApiClient(_BaseRestClient):
         )
         self.set_credentials(header=header)
 
-    async def _request(self, method: HttpMethod, endpoint: str, **kwargs: Any) -> httpx.Response:
+    async def _request(
+        self, method: HttpMethod, endpoint: str, data: dict | None = None, **kwargs: Any
+    ) -> httpx.Response:
         """Make an async HTTP request.
 
         Args:
             method: HTTP method from HttpMethod enum.
             endpoint: Endpoint path or full URL.
+            data: Optional JSON body, compressed according to the client's compression settings.
             **kwargs: Additional arguments passed to httpx.AsyncClient.request().
 
         Returns:
-            httpx.Response object.
+            httpx.Response object, with TransferStats available via get_transfer_stats().
         """
         endpoint = self.normalize_endpoint(endpoint, self.add_trailing_slash)
-        self.logger.debug(f"Making {method} request to {endpoint} with kwargs: {kwargs}")
+        self.logger.debug(f"Making {method} request to {endpoint} with data: {data}, kwargs: {kwargs}")
+        request_bytes_decoded = None
+        if data is not None:
+            body_kwargs, request_bytes_decoded = await self.aencode_body(data)
+            kwargs.update(body_kwargs)
         response = await self.client.request(method, endpoint, **kwargs)
+        self.record_transfer_stats(response, request_bytes_decoded)
         response.raise_for_status()
         return response
 
+    async def aencode_body(self, data: dict) -> tuple[dict[str, Any], int | None]:
+        """Like encode_body(), but serializes and compresses the body in a worker thread.
+
+        Keeps the event loop responsive while large bulk payloads are encoded.
+        """
+        if self.compression is None:
+            return self.encode_body(data)
+        return await asyncio.to_thread(self.encode_body, data)
+
     async def get(self, endpoint: str, params: dict | None = None) -> httpx.Response:
         return await self._request(HttpMethod.GET, endpoint, params=params or {})
 
     async def post(self, endpoint: str, data: dict | None = None) -> httpx.Response:
-        return await self._request(HttpMethod.POST, endpoint, json=data or {})
+        return await self._request(HttpMethod.POST, endpoint, data=data or {})
 
     async def put(self, endpoint: str, data: dict | None = None) -> httpx.Response:
-        return await self._request(HttpMethod.PUT, endpoint, json=data or {})
+        return await self._request(HttpMethod.PUT, endpoint, data=data or {})
 
     async def patch(self, endpoint: str, data: dict | None = None) -> httpx.Response:
-        return await self._request(HttpMethod.PATCH, endpoint, json=data or {})
+        return await self._request(HttpMethod.PATCH, endpoint, data=data or {})
 
     async def delete(self, endpoint: str) -> httpx.Response:
         return await self._request(HttpMethod.DELETE, endpoint)
@@ -9,3 +9,13 @@ class HttpMethod(StrEnum):
     PUT = "PUT"
     PATCH = "PATCH"
     DELETE = "DELETE"
+
+
+class ContentEncoding(StrEnum):
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
+DEFAULT_COMPRESSION_THRESHOLD = 1024
+DEFAULT_GZIP_COMPRESSION_LEVEL = 6
+DEFAULT_ZSTD_COMPRESSION_LEVEL = 3
@@ -0,0 +1,88 @@
+import asyncio
+import multiprocessing
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+from pyrest_model_client.base import T, parse_model_fields
+
+
+def is_free_threaded() -> bool:
+    """Return True when running on a free-threaded (no-GIL) interpreter such as 3.13t."""
+    return hasattr(sys, "_is_gil_enabled") and not sys._is_gil_enabled()  # pylint: disable=no-member,protected-access
+
+
+class ModelHydrator:
+    """Validates raw response pages into model instances off the calling thread.
+
+    CPU-bound pydantic validation of large pages runs on a worker pool, so an
+    AsyncRestApiClient event loop stays free to keep fetching. A process pool is used
+    by default, started with "spawn" so workers are never forked from a process
+    with live event-loop or executor threads. On free-threaded interpreters a
+    thread pool is used instead, which avoids pickling the results.
+
+    Models are returned to the caller pickled, so model classes must be importable
+    at module level. Spawned workers re-import the calling script, so scripts using
+    the default process pool must guard their entry point with
+    `if __name__ == "__main__":`.
+    """
+
+    def __init__(self, max_workers: int | None = None, executor: Executor | None = None) -> None:
+        """Initialize the ModelHydrator.
+
+        Args:
+            max_workers: Number of workers for the default pool. Ignored if executor is given.
+            executor: Existing executor to run validation on. It is not shut down by the hydrator.
+        """
+        self._owns_executor = executor is None
+        self.executor = executor or self.get_default_executor(max_workers=max_workers)
+
+    @staticmethod
+    def get_default_executor(max_workers: int | None) -> Executor:
+        if is_free_threaded():
+            return ThreadPoolExecutor(max_workers=max_workers)
+        return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def hydrate(self, content: bytes | str, model: type[T], results_key: str | None = None) -> list[T]:
+        """Validate a raw JSON page on the worker pool and wait for the result.
+
+        Args:
+            content: Raw JSON response body (e.g., httpx.Response.content).
+            model: The model class to instantiate.
+            results_key: Key holding the item list in paginated responses (e.g., "results").
+
+        Returns:
+            List of model instances.
+        """
+        return self.executor.submit(parse_model_fields, content, model, results_key).result()
+
+    async def ahydrate(self, content: bytes | str, model: type[T], results_key: str | None = None) -> list[T]:
+        """Validate a raw JSON page on the worker pool without blocking the event loop.
+
+        Args:
+            content: Raw JSON response body (e.g., httpx.Response.content).
+            model: The model class to instantiate.
+            results_key: Key holding the item list in paginated responses (e.g., "results").
+
+        Returns:
+            List of model instances.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, parse_model_fields, content, model, results_key)
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool if it was created by the hydrator."""
+        if self._owns_executor:
+            self.executor.shutdown()
+
+    def __enter__(self) -> "ModelHydrator":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.shutdown()
+
+    async def __aenter__(self) -> "ModelHydrator":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await asyncio.to_thread(self.shutdown)
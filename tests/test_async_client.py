@@ -1,9 +1,14 @@
+import asyncio
+import gzip
+import json
+
 import httpx
 import pytest
 import respx
 from httpx import Response
+from pytest_mock import MockerFixture
 
-from pyrest_model_client import AsyncRestApiClient, build_header
+from pyrest_model_client import AsyncRestApiClient, CompressionConfig, build_header, get_transfer_stats
 
 
 @pytest.fixture(name="mock_headers")
@@ -74,3 +79,32 @@ async def test_async_client_close(mock_headers: dict) -> None:
     assert client.client.is_closed is False
     await client.aclose()
     assert client.client.is_closed is True
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_post_compressed(mock_headers: dict) -> None:
+    payload = {"items": ["value"] * 100}
+    route = respx.post("http://api.test/create/").mock(return_value=Response(201, json={}))
+    async with AsyncRestApiClient(header=mock_headers, base_url="http://api.test") as client:
+        client.set_compression(CompressionConfig(threshold=64))
+        response = await client.post("create", data=payload)
+    request = route.calls.last.request
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(request.content)) == payload
+    assert get_transfer_stats(response).request_bytes_sent == len(request.content)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_post_encodes_in_worker_thread(mocker: MockerFixture, mock_headers: dict) -> None:
+    respx.post("http://api.test/create/").mock(return_value=Response(201, json={}))
+    to_thread = mocker.spy(asyncio, "to_thread")
+    async with AsyncRestApiClient(header=mock_headers, base_url="http://api.test") as client:
+        await client.post("create", data={"items": ["value"] * 100})
+        assert to_thread.call_count == 0
+        client.set_compression(CompressionConfig(threshold=64))
+        await client.post("create", data={"name": "small"})
+        await client.post("create", data={"items": ["value"] * 100})
+        assert to_thread.call_count == 2
+        assert to_thread.call_args.args == (client.encode_body, {"items": ["value"] * 100})
@@ -2,7 +2,7 @@ import pytest
 from pydantic import ValidationError
 
 from pyrest_model_client import BaseAPIModel, RestApiClient, build_header
-from pyrest_model_client.base import get_model_fields
+from pyrest_model_client.base import get_model_fields, parse_model_fields
 
 
 class User(BaseAPIModel):
@@ -89,3 +89,16 @@ def test_get_resource_url() -> None:
     user_with_id = User(id=123, name="Alice", email="alice@test.com", resource_path="users")
     assert user_with_id.get_resource_url(client) == "http://api.test/users"
     assert user_with_id.get_resource_url(client, include_id=True) == "http://api.test/users/123"
+
+
+def test_parse_model_fields_from_list_body() -> None:
+    content = b'[{"id": 1, "name": "Alice", "email": "alice@test.com"}]'
+    users = parse_model_fields(content, User)
+    assert isinstance(users[0], User)
+    assert users[0].name == "Alice"
+
+
+def test_parse_model_fields_with_results_key() -> None:
+    content = b'{"next": null, "results": [{"id": 2, "name": "Bob", "email": "bob@test.com"}]}'
+    users = parse_model_fields(content, User, results_key="results")
+    assert users[0].id == 2
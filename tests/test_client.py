@@ -1,11 +1,14 @@
+import gzip
+import importlib
 import json
 
 import httpx
 import pytest
 import respx
 from httpx import Response
+from pytest_mock import MockerFixture
 
-from pyrest_model_client import RestApiClient, build_header
+from pyrest_model_client import CompressionConfig, ContentEncoding, RestApiClient, build_header, get_transfer_stats
 
 
 @pytest.fixture(name="mock_headers")
@@ -133,3 +136,108 @@ def test_endpoint_without_trailing_slash() -> None:
     route = respx.get("http://api.test/users").mock(return_value=Response(200, json={}))
     client_no_slash.get("users")
     assert route.called
+
+
+@respx.mock
+def test_post_below_threshold_is_not_compressed(mock_headers: dict) -> None:
+    client = RestApiClient(header=mock_headers, base_url="http://api.test")
+    client.set_compression(CompressionConfig())
+    route = respx.post("http://api.test/create/").mock(return_value=Response(201, json={}))
+    client.post("create", data={"name": "test"})
+    request = route.calls.last.request
+    assert "Content-Encoding" not in request.headers
+    assert json.loads(request.content) == {"name": "test"}
+
+
+@respx.mock
+def test_compression_keeps_client_content_type() -> None:
+    headers = build_header(token="test-token", content_type="application/vnd.api+json")
+    client = RestApiClient(header=headers, base_url="http://api.test")
+    client.set_compression(CompressionConfig(threshold=64))
+    route = respx.post("http://api.test/create/").mock(return_value=Response(201, json={}))
+    client.post("create", data={"a": 1})
+    assert route.calls.last.request.headers["Content-Type"] == "application/vnd.api+json"
+    client.post("create", data={"items": ["value"] * 100})
+    assert route.calls.last.request.headers["Content-Type"] == "application/vnd.api+json"
+    assert route.calls.last.request.headers["Content-Encoding"] == "gzip"
+
+
+@respx.mock
+def test_post_above_threshold_is_gzip_compressed(mock_headers: dict) -> None:
+    client = RestApiClient(header=mock_headers, base_url="http://api.test")
+    client.set_compression(CompressionConfig(threshold=64))
+    route = respx.post("http://api.test/create/").mock(return_value=Response(201, json={}))
+    payload = {"items": ["value"] * 100}
+    response = client.post("create", data=payload)
+    request = route.calls.last.request
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(request.content)) == payload
+
+    stats = get_transfer_stats(response)
+    assert stats.request_bytes_sent == len(request.content)
+    assert stats.request_bytes_decoded > stats.request_bytes_sent
+
+
+@respx.mock
+def test_post_above_threshold_is_zstd_compressed(mock_headers: dict) -> None:
+    zstandard = pytest.importorskip("zstandard")
+    client = RestApiClient(header=mock_headers, base_url="http://api.test")
+    client.set_compression(CompressionConfig(encoding=ContentEncoding.ZSTD, threshold=64))
+    route = respx.post("http://api.test/create/").mock(return_value=Response(201, json={}))
+    payload = {"items": ["value"] * 100}
+    client.post("create", data=payload)
+    request = route.calls.last.request
+    assert request.headers["Content-Encoding"] == "zstd"
+    assert json.loads(zstandard.ZstdDecompressor().decompressobj().decompress(request.content)) == payload
+
+
+@respx.mock
+def test_transfer_stats_for_compressed_response(client: RestApiClient) -> None:
+    body = json.dumps({"items": ["value"] * 100}).encode()
+    respx.get("http://api.test/items/").mock(
+        return_value=Response(200, content=gzip.compress(body), headers={"Content-Encoding": "gzip"})
+    )
+    response = client.get("items")
+    stats = get_transfer_stats(response)
+    assert stats.response_bytes_decoded == len(body)
+    assert stats.response_bytes_received < stats.response_bytes_decoded
+
+
+def _can_import(*names: str) -> bool:
+    for name in names:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        return True
+    return False
+
+
+def test_accept_encoding_advertises_installed_codecs(client: RestApiClient) -> None:
+    accept_encoding = [encoding.strip() for encoding in client.client.headers["Accept-Encoding"].split(",")]
+    assert "gzip" in accept_encoding
+    assert ("zstd" in accept_encoding) == _can_import("zstandard")
+    assert ("br" in accept_encoding) == _can_import("brotli", "brotlicffi")
+
+
+def test_compression_level_is_configurable(mocker: MockerFixture) -> None:
+    compress = mocker.spy(gzip, "compress")
+    CompressionConfig().compress(b"{}")
+    CompressionConfig(level=1).compress(b"{}")
+    assert [call.kwargs["compresslevel"] for call in compress.call_args_list] == [6, 1]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"threshold": -1},
+        {"level": 10},
+        {"level": -2},
+        {"encoding": ContentEncoding.ZSTD, "level": 99},
+    ],
+)
+def test_compression_config_rejects_invalid_settings(kwargs: dict) -> None:
+    if kwargs.get("encoding") == ContentEncoding.ZSTD:
+        pytest.importorskip("zstandard")
+    with pytest.raises(ValueError):
+        CompressionConfig(**kwargs)
@@ -0,0 +1,63 @@
+import json
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from pydantic import ValidationError
+
+from pyrest_model_client import ModelHydrator
+from pyrest_model_client.hydration import is_free_threaded
+from tests.test_base import User
+
+PAGE = json.dumps(
+    {"next": None, "results": [{"id": i, "name": f"user-{i}", "email": f"user-{i}@test.com"} for i in range(50)]}
+).encode()
+
+
+@pytest.fixture(name="hydrator")
+def _hydrator() -> Iterator[ModelHydrator]:
+    with ModelHydrator(max_workers=1) as hydrator:
+        yield hydrator
+
+
+def test_hydrate_in_worker_process(hydrator: ModelHydrator) -> None:
+    users = hydrator.hydrate(PAGE, User, results_key="results")
+    assert len(users) == 50
+    assert isinstance(users[0], User)
+    assert users[49].email == "user-49@test.com"
+
+
+@pytest.mark.asyncio
+async def test_ahydrate_in_worker_process(hydrator: ModelHydrator) -> None:
+    users = await hydrator.ahydrate(PAGE, User, results_key="results")
+    assert [user.id for user in users] == list(range(50))
+
+
+def test_hydrate_propagates_validation_error(hydrator: ModelHydrator) -> None:
+    with pytest.raises(ValidationError):
+        hydrator.hydrate(b'[{"id": 1}]', User)
+
+
+def test_external_executor_is_not_shut_down() -> None:
+    executor = ThreadPoolExecutor(max_workers=1)
+    with ModelHydrator(executor=executor) as hydrator:
+        assert hydrator.hydrate(b'[{"id": 1, "name": "a", "email": "a@b.com"}]', User)[0].name == "a"
+    assert executor.submit(lambda: 1).result() == 1
+    executor.shutdown()
+
+
+def test_default_executor_is_spawned_process_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: True, raising=False)
+    executor = ModelHydrator.get_default_executor(max_workers=1)
+    assert isinstance(executor, ProcessPoolExecutor)
+    assert executor._mp_context.get_start_method() == "spawn"
+    executor.shutdown()
+
+
+def test_default_executor_is_thread_pool_when_free_threaded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: False, raising=False)
+    assert is_free_threaded()
+    executor = ModelHydrator.get_default_executor(max_workers=1)
+    assert isinstance(executor, ThreadPoolExecutor)
+    executor.shutdown()